@@ -2,6 +2,7 @@
 from datetime import datetime
 import difflib
 import enum
+import functools
 import getpass
 import json
 import os
@@ -68,6 +69,7 @@ logger = sky_logging.init_logger(__name__)
 SKY_REMOTE_APP_DIR = '~/.sky/sky_app'
 SKY_RAY_YAML_REMOTE_PATH = '~/.sky/sky_ray.yml'
 IP_ADDR_REGEX = r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}'
+IP_ADDR_PATTERN = re.compile(IP_ADDR_REGEX)
 SKY_REMOTE_PATH = '~/.sky/wheels'
 SKY_USER_FILE_PATH = '~/.sky/generated'
 
@@ -145,10 +147,25 @@ RAY_STATUS_WITH_SKY_RAY_PORT_COMMAND = (
     'print(job_lib.get_ray_port())" 2> /dev/null || echo 6379);'
     'RAY_ADDRESS=127.0.0.1:$RAY_PORT ray status')
 
+# Mapping from cloud class to the function that adds the SSH key info to the
+# cluster config of that cloud.
+_CLOUD_TO_AUTH_SETUP_FN = {
+    clouds.AWS: auth.setup_aws_authentication,
+    clouds.GCP: auth.setup_gcp_authentication,
+    clouds.Azure: auth.setup_azure_authentication,
+    clouds.Lambda: auth.setup_lambda_authentication,
+    clouds.IBM: auth.setup_ibm_authentication,
+    clouds.SCP: auth.setup_scp_authentication,
+    clouds.OCI: auth.setup_oci_authentication,
+}
+
+# Local dir that holds the compiled bytecode of the Jinja templates.
+_JINJA_BYTECODE_CACHE_DIR = '~/.sky/.jinja_cache'
+
 
 def is_ip(s: str) -> bool:
     """Returns whether this string matches IP_ADDR_REGEX."""
-    return len(re.findall(IP_ADDR_REGEX, s)) == 1
+    return len(IP_ADDR_PATTERN.findall(s)) == 1
 
 
 def _get_yaml_path_from_cluster_name(cluster_name: str,
@@ -159,6 +176,30 @@ def _get_yaml_path_from_cluster_name(cluster_name: str,
     return str(output_path)
 
 
+@functools.lru_cache(maxsize=1)
+def _get_jinja_env() -> jinja2.Environment:
+    """Returns the shared Jinja environment for the templates.
+
+    The environment compiles each template only once per process. The bytecode
+    cache keeps the compiled templates across runs; it is keyed on the template
+    source, so changes to a template are still picked up. The bytecode cache
+    is skipped if its dir is not writable.
+    """
+    bytecode_cache = None
+    cache_dir = os.path.expanduser(_JINJA_BYTECODE_CACHE_DIR)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+    except OSError as e:
+        logger.debug(f'Failed to create the Jinja bytecode cache dir: {e}')
+    if os.access(cache_dir, os.W_OK):
+        bytecode_cache = jinja2.FileSystemBytecodeCache(cache_dir)
+    loader = jinja2.FileSystemLoader(os.path.join(sky.__root_dir__,
+                                                  'templates'))
+    return jinja2.Environment(loader=loader,
+                              auto_reload=False,
+                              bytecode_cache=bytecode_cache)
+
+
 def fill_template(template_name: str, variables: Dict,
                   output_path: str) -> None:
     """Create a file from a Jinja template and return the filename."""
@@ -166,16 +207,14 @@ def fill_template(template_name: str, variables: Dict,
     template_path = os.path.join(sky.__root_dir__, 'templates', template_name)
     if not os.path.exists(template_path):
         raise FileNotFoundError(f'Template "{template_name}" does not exist.')
-    with open(template_path) as fin:
-        template = fin.read()
     output_path = os.path.abspath(os.path.expanduser(output_path))
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
     # Write out yaml config.
-    j2_template = jinja2.Template(template)
-    content = j2_template.render(**variables)
-    with open(output_path, 'w') as fout:
-        fout.write(content)
+    j2_template = _get_jinja_env().get_template(template_name)
+    # Stream the rendered template to the file, instead of building the full
+    # content as a string first.
+    j2_template.stream(**variables).dump(output_path, encoding='utf-8')
 
 
 def _optimize_file_mounts(yaml_path: str) -> None:
@@ -902,71 +941,69 @@ def write_cluster_config(
     # Use a tmp file path to avoid incomplete YAML file being re-used in the
     # future.
     tmp_yaml_path = yaml_path + '.tmp'
+    sky_ray_yaml_local_path = (
+        tmp_yaml_path if not isinstance(cloud, clouds.Local) else yaml_path)
     fill_template(
         cluster_config_template,
-        dict(
-            resources_vars,
-            **{
-                'cluster_name': cluster_name,
-                'num_nodes': num_nodes,
-                'disk_size': to_provision.disk_size,
-                # If the current code is run by controller, propagate the real
-                # calling user which should've been passed in as the
-                # SKYPILOT_USER env var (see spot-controller.yaml.j2).
-                'user': os.environ.get('SKYPILOT_USER', getpass.getuser()),
-
-                # AWS only:
-                # Temporary measure, as deleting per-cluster SGs is too slow.
-                # See https://github.com/skypilot-org/skypilot/pull/742.
-                # Generate the name of the security group we're looking for.
-                # (username, last 4 chars of hash of hostname): for uniquefying
-                # users on shared-account scenarios.
-                'security_group': skypilot_config.get_nested(
-                    ('aws', 'security_group_name'),
-                    f'sky-sg-{common_utils.user_and_hostname_hash()}'),
-                'vpc_name': skypilot_config.get_nested(('aws', 'vpc_name'),
-                                                       None),
-                'use_internal_ips': skypilot_config.get_nested(
-                    ('aws', 'use_internal_ips'), False),
-                # Not exactly AWS only, but we only test it's supported on AWS
-                # for now:
-                'ssh_proxy_command': ssh_proxy_command,
-                # User-supplied instance tags.
-                'instance_tags': instance_tags,
-
-                # Azure only:
-                'azure_subscription_id': azure_subscription_id,
-                'resource_group': f'{cluster_name}-{region_name}',
-
-                # GCP only:
-                'gcp_project_id': gcp_project_id,
-
-                # Port of Ray (GCS server).
-                # Ray's default port 6379 is conflicted with Redis.
-                'ray_port': constants.SKY_REMOTE_RAY_PORT,
-                'ray_dashboard_port': constants.SKY_REMOTE_RAY_DASHBOARD_PORT,
-                'ray_temp_dir': constants.SKY_REMOTE_RAY_TEMPDIR,
-                'dump_port_command': dump_port_command,
-                # Ray version.
-                'ray_version': constants.SKY_REMOTE_RAY_VERSION,
-                # Cloud credentials for cloud storage.
-                'credentials': credentials,
-                # Sky remote utils.
-                'sky_remote_path': SKY_REMOTE_PATH,
-                'sky_local_path': str(local_wheel_path),
-                # Add yaml file path to the template variables.
-                'sky_ray_yaml_remote_path': SKY_RAY_YAML_REMOTE_PATH,
-                'sky_ray_yaml_local_path':
-                    tmp_yaml_path
-                    if not isinstance(cloud, clouds.Local) else yaml_path,
-                'sky_version': str(version.parse(sky.__version__)),
-                'sky_wheel_hash': wheel_hash,
-                # Local IP handling (optional).
-                'head_ip': None if ip_list is None else ip_list[0],
-                'worker_ips': None if ip_list is None else ip_list[1:],
-                # Authentication (optional).
-                **auth_config,
-            }),
+        {
+            **resources_vars,
+            'cluster_name': cluster_name,
+            'num_nodes': num_nodes,
+            'disk_size': to_provision.disk_size,
+            # If the current code is run by controller, propagate the real
+            # calling user which should've been passed in as the
+            # SKYPILOT_USER env var (see spot-controller.yaml.j2).
+            'user': os.environ.get('SKYPILOT_USER', getpass.getuser()),
+
+            # AWS only:
+            # Temporary measure, as deleting per-cluster SGs is too slow.
+            # See https://github.com/skypilot-org/skypilot/pull/742.
+            # Generate the name of the security group we're looking for.
+            # (username, last 4 chars of hash of hostname): for uniquefying
+            # users on shared-account scenarios.
+            'security_group': skypilot_config.get_nested(
+                ('aws', 'security_group_name'),
+                f'sky-sg-{common_utils.user_and_hostname_hash()}'),
+            'vpc_name': skypilot_config.get_nested(('aws', 'vpc_name'), None),
+            'use_internal_ips': skypilot_config.get_nested(
+                ('aws', 'use_internal_ips'), False),
+            # Not exactly AWS only, but we only test it's supported on AWS
+            # for now:
+            'ssh_proxy_command': ssh_proxy_command,
+            # User-supplied instance tags.
+            'instance_tags': instance_tags,
+
+            # Azure only:
+            'azure_subscription_id': azure_subscription_id,
+            'resource_group': f'{cluster_name}-{region_name}',
+
+            # GCP only:
+            'gcp_project_id': gcp_project_id,
+
+            # Port of Ray (GCS server).
+            # Ray's default port 6379 is conflicted with Redis.
+            'ray_port': constants.SKY_REMOTE_RAY_PORT,
+            'ray_dashboard_port': constants.SKY_REMOTE_RAY_DASHBOARD_PORT,
+            'ray_temp_dir': constants.SKY_REMOTE_RAY_TEMPDIR,
+            'dump_port_command': dump_port_command,
+            # Ray version.
+            'ray_version': constants.SKY_REMOTE_RAY_VERSION,
+            # Cloud credentials for cloud storage.
+            'credentials': credentials,
+            # Sky remote utils.
+            'sky_remote_path': SKY_REMOTE_PATH,
+            'sky_local_path': str(local_wheel_path),
+            # Add yaml file path to the template variables.
+            'sky_ray_yaml_remote_path': SKY_RAY_YAML_REMOTE_PATH,
+            'sky_ray_yaml_local_path': sky_ray_yaml_local_path,
+            'sky_version': str(version.parse(sky.__version__)),
+            'sky_wheel_hash': wheel_hash,
+            # Local IP handling (optional).
+            'head_ip': None if ip_list is None else ip_list[0],
+            'worker_ips': None if ip_list is None else ip_list[1:],
+            # Authentication (optional).
+            **auth_config,
+        },
         output_path=tmp_yaml_path)
     config_dict['cluster_name'] = cluster_name
     config_dict['ray'] = yaml_path
@@ -1019,18 +1056,20 @@ def write_cluster_config(
         config = common_utils.read_yaml(os.path.expanduser(config_dict['ray']))
         vpc_name = gcp_config.get_usable_vpc(config)
 
+        # The create and delete scripts share the same variables.
+        tpu_script_variables = {
+            **resources_vars,
+            'tpu_name': tpu_name,
+            'gcp_project_id': gcp_project_id,
+            'vpc_name': vpc_name,
+        }
         scripts = []
         for template_name in ('gcp-tpu-create.sh.j2', 'gcp-tpu-delete.sh.j2'):
             script_path = os.path.join(user_file_dir, template_name).replace(
                 '.sh.j2', f'.{cluster_name}.sh')
             fill_template(
                 template_name,
-                dict(
-                    resources_vars, **{
-                        'tpu_name': tpu_name,
-                        'gcp_project_id': gcp_project_id,
-                        'vpc_name': vpc_name,
-                    }),
+                tpu_script_variables,
                 # Use new names for TPU scripts so that different runs can use
                 # different TPUs.  Put in SKY_USER_FILE_PATH to be consistent
                 # with cluster yamls.
@@ -1048,29 +1087,17 @@ def _add_auth_to_cluster_config(cloud: clouds.Cloud, cluster_config_file: str):
     """Adds SSH key info to the cluster config.
 
     This function's output removes comments included in the jinja2 template.
+    For Local clouds, the jinja2 output is left unchanged.
     """
-    config = common_utils.read_yaml(cluster_config_file)
-    # Check the availability of the cloud type.
-    if isinstance(cloud, clouds.AWS):
-        config = auth.setup_aws_authentication(config)
-    elif isinstance(cloud, clouds.GCP):
-        config = auth.setup_gcp_authentication(config)
-    elif isinstance(cloud, clouds.Azure):
-        config = auth.setup_azure_authentication(config)
-    elif isinstance(cloud, clouds.Lambda):
-        config = auth.setup_lambda_authentication(config)
-    elif isinstance(cloud, clouds.IBM):
-        config = auth.setup_ibm_authentication(config)
-    elif isinstance(cloud, clouds.SCP):
-        config = auth.setup_scp_authentication(config)
-    elif isinstance(cloud, clouds.OCI):
-        config = auth.setup_oci_authentication(config)
-    else:
-        assert isinstance(cloud, clouds.Local), cloud
+    if isinstance(cloud, clouds.Local):
         # Local cluster case, authentication is already filled by the user
         # in the local cluster config (in ~/.sky/local/...). There is no need
-        # for Sky to generate authentication.
-        pass
+        # for Sky to generate authentication, so skip the YAML round-trip.
+        return
+    setup_authentication = _CLOUD_TO_AUTH_SETUP_FN.get(type(cloud))
+    assert setup_authentication is not None, cloud
+    config = common_utils.read_yaml(cluster_config_file)
+    config = setup_authentication(config)
     common_utils.dump_yaml(cluster_config_file, config)
 
 
@@ -1140,6 +1167,9 @@ def wait_until_ray_cluster_ready(
     last_nodes_so_far = 0
     start = time.time()
     runner = command_runner.SSHCommandRunner(head_ip, **ssh_credentials)
+    # Poll with jittered exponential backoff (from ~1s up to ~10s), so that
+    # fast-booting clusters are detected sooner than with a fixed interval.
+    backoff = common_utils.Backoff(initial_backoff=1, max_backoff_factor=10)
     with log_utils.console.status(
             '[bold cyan]Waiting for workers...') as worker_status:
         while True:
@@ -1206,7 +1236,7 @@ def wait_until_ray_cluster_ready(
                     'Failed to launch multiple nodes on '
                     'GCP due to a nondeterministic bug in ray autoscaler.')
                 return False  # failed
-            time.sleep(10)
+            time.sleep(backoff.current_backoff())
     return True  # success
 
 
@@ -1357,7 +1387,7 @@ def _query_head_ip_with_retries(cluster_yaml: str,
                 f'ray get-head-ip {full_cluster_yaml!r}',
                 stdout=subprocess.PIPE,
                 stderr=subprocess.DEVNULL).stdout.decode().strip()
-            head_ip_list = re.findall(IP_ADDR_REGEX, out)
+            head_ip_list = IP_ADDR_PATTERN.findall(out)
             if len(head_ip_list) > 1:
                 # This could be triggered if e.g., some logging is added in
                 # skypilot_config, a module that has some code executed
@@ -1450,7 +1480,7 @@ def get_node_ips(cluster_yaml: str,
                              f'[{retry_cnt}/{worker_ip_max_attempts}] in '
                              f'{backoff_time} seconds.')
                 time.sleep(backoff_time)
-        worker_ips = re.findall(IP_ADDR_REGEX, out)
+        worker_ips = IP_ADDR_PATTERN.findall(out)
         # Ray Autoscaler On-prem Bug: ray-get-worker-ips outputs nothing!
         # Workaround: List of IPs are shown in Stderr
         cluster_name = os.path.basename(cluster_yaml).split('.')[0]
@@ -1458,7 +1488,7 @@ def get_node_ips(cluster_yaml: str,
              handle.local_handle is not None) or
                 onprem_utils.check_if_local_cloud(cluster_name)):
             out = proc.stderr.decode()
-            worker_ips = re.findall(IP_ADDR_REGEX, out)
+            worker_ips = IP_ADDR_PATTERN.findall(out)
             # Remove head ip from worker ip list.
             for i, ip in enumerate(worker_ips):
                 if ip == head_ip_list[0]:
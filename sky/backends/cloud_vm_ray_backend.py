@@ -1748,8 +1748,8 @@ class RetryingVmProvisioner(object):
             # Last line looks like: 'ssh ... <user>@<public head_ip>\n'
             position = stdout.rfind('@')
             # Use a regex to extract the IP address.
-            ip_list = re.findall(backend_utils.IP_ADDR_REGEX,
-                                 stdout[position + 1:])
+            ssh_host = stdout[position + 1:]
+            ip_list = backend_utils.IP_ADDR_PATTERN.findall(ssh_host)
             # If something's wrong. Ok to not return a head_ip.
             head_ip = None
             if len(ip_list) == 1:
@@ -2649,8 +2649,9 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
 
         setup_script = log_lib.make_task_bash_script(task.setup,
                                                      env_vars=task.envs)
-        with tempfile.NamedTemporaryFile('w', prefix='sky_setup_') as f:
-            f.write(setup_script)
+        # Write the encoded script in binary mode, skipping text-mode I/O.
+        with tempfile.NamedTemporaryFile('wb', prefix='sky_setup_') as f:
+            f.write(setup_script.encode('utf-8'))
             f.flush()
             setup_sh_path = f.name
             setup_file = os.path.basename(setup_sh_path)
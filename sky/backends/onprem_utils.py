@@ -549,8 +549,8 @@ def do_filemounts_and_setup_on_local_workers(
         worker_ips, **ssh_credentials)
 
     # Uploads setup script to the worker node
-    with tempfile.NamedTemporaryFile('w', prefix='sky_setup_') as f:
-        f.write(setup_script)
+    with tempfile.NamedTemporaryFile('wb', prefix='sky_setup_') as f:
+        f.write(setup_script.encode('utf-8'))
         f.flush()
         setup_sh_path = f.name
         setup_file = os.path.basename(setup_sh_path)
@@ -148,6 +148,13 @@ def build_sky_wheel() -> Tuple[pathlib.Path, str]:
         # wheel content hash doesn't change.
         temp_wheel_dir = pathlib.Path(tempfile.gettempdir()) / wheel_hash
         temp_wheel_dir.mkdir(parents=True, exist_ok=True)
-        shutil.copy(latest_wheel, temp_wheel_dir)
+        # The dir is keyed by the wheel content hash, so an existing wheel in
+        # it is identical and does not need to be copied again. Copy through
+        # a tmp file, so that a partially copied wheel is never reused.
+        temp_wheel_path = temp_wheel_dir / latest_wheel.name
+        if not temp_wheel_path.exists():
+            tmp_copy_path = temp_wheel_path.with_suffix('.tmp')
+            shutil.copy(latest_wheel, tmp_copy_path)
+            os.replace(tmp_copy_path, temp_wheel_path)
 
     return temp_wheel_dir.absolute(), wheel_hash
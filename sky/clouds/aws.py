@@ -168,6 +168,7 @@ class AWS(clouds.Cloud):
                 yield r.zones
 
     @classmethod
+    @functools.lru_cache(maxsize=64)  # Cache since catalog lookup is slow.
     def _get_default_ami(cls, region_name: str, instance_type: str) -> str:
         acc = cls.get_accelerators_from_instance_type(instance_type)
         image_id = service_catalog.get_image_id_from_tag(
@@ -128,11 +128,13 @@ def read_catalog(filename: str,
                             raise e
                 else:
                     # Download successful, save the catalog to a local file.
+                    # Use the raw response bytes for both the file and its
+                    # md5, instead of decoding and re-encoding the text.
                     os.makedirs(os.path.dirname(catalog_path), exist_ok=True)
-                    with open(catalog_path, 'w') as f:
-                        f.write(r.text)
-                    with open(meta_path + '.md5', 'w') as f:
-                        f.write(hashlib.md5(r.text.encode()).hexdigest())
+                    with open(catalog_path, 'wb') as f:
+                        f.write(r.content)
+                    with open(meta_path + '.md5', 'w') as md5_file:
+                        md5_file.write(hashlib.md5(r.content).hexdigest())
 
     try:
         df = pd.read_csv(catalog_path)
@@ -3,7 +3,6 @@
 This is a remote utility module that provides logging functionality.
 """
 import copy
-import io
 import multiprocessing.pool
 import os
 import subprocess
@@ -51,11 +50,46 @@ class _ProcessingArgs:
 
 def _handle_io_stream(io_stream, out_stream, args: _ProcessingArgs):
     """Process the stream of a process."""
-    out_io = io.TextIOWrapper(io_stream,
-                              encoding='utf-8',
-                              newline='',
-                              errors='replace',
-                              write_through=True)
+
+    def _read_line_blocks():
+        # Read whatever output is available (read1() does at most one read on
+        # the underlying pipe), and yield the complete lines in it decoded at
+        # once, i.e. up to the last '\r' or '\n'. Cutting at a line break
+        # never splits a multi-byte character. A trailing '\r' is held back,
+        # as it may be the first half of a '\r\n'. Only the new chunk is
+        # searched for line breaks, and the pieces of an incomplete line are
+        # joined once it completes, so that long lines take linear time.
+        pending = []
+        while True:
+            chunk = io_stream.read1(65536)
+            if not chunk:
+                break
+            end = len(chunk) - 1 if chunk.endswith(b'\r') else len(chunk)
+            last_break = max(chunk.rfind(b'\n', 0, end),
+                             chunk.rfind(b'\r', 0, end))
+            if last_break < 0 and not (pending and pending[-1].endswith(b'\r')):
+                pending.append(chunk)
+                continue
+            # Either the chunk has a line break, or the held back '\r' is not
+            # followed by a '\n' and ends a line on its own.
+            cut = last_break + 1
+            pending.append(chunk[:cut])
+            yield b''.join(pending).decode('utf-8', errors='replace')
+            pending = [chunk[cut:]] if cut < len(chunk) else []
+        if pending:
+            yield b''.join(pending).decode('utf-8', errors='replace')
+
+    def _split_lines(block: str):
+        # str.splitlines() also splits on other characters (e.g. '\x0c'),
+        # so join the pieces back until a '\r' or '\n' line ending.
+        line = ''
+        for piece in block.splitlines(keepends=True):
+            line += piece
+            if piece.endswith(('\n', '\r')):
+                yield line
+                line = ''
+        if line:
+            yield line
 
     start_streaming_flag = False
     end_streaming_flag = False
@@ -66,38 +100,35 @@ def _handle_io_stream(io_stream, out_stream, args: _ProcessingArgs):
     out = []
     with open(args.log_path, 'a') as fout:
         with line_processor:
-            while True:
-                line = out_io.readline()
-                if not line:
-                    break
-                # start_streaming_at logic in processor.process_line(line)
-                if args.replace_crlf and line.endswith('\r\n'):
-                    # Replace CRLF with LF to avoid ray logging to the same
-                    # line due to separating lines with '\n'.
-                    line = line[:-2] + '\n'
-                if (args.skip_lines is not None and
-                        any(skip in line for skip in args.skip_lines)):
-                    continue
-                if args.start_streaming_at in line:
-                    start_streaming_flag = True
-                if (args.end_streaming_at is not None and
-                        args.end_streaming_at in line):
-                    # Keep executing the loop, only stop streaming.
-                    # E.g., this is used for `sky bench` to hide the
-                    # redundant messages of `sky launch` while
-                    # saving them in log files.
-                    end_streaming_flag = True
-                if (args.stream_logs and start_streaming_flag and
-                        not end_streaming_flag):
-                    print(streaming_prefix + line,
-                          end='',
-                          file=out_stream,
-                          flush=True)
-                if args.log_path != '/dev/null':
-                    fout.write(line)
-                    fout.flush()
-                line_processor.process_line(line)
-                out.append(line)
+            for block in _read_line_blocks():
+                for line in _split_lines(block):
+                    # start_streaming_at logic in processor.process_line(line)
+                    if args.replace_crlf and line.endswith('\r\n'):
+                        # Replace CRLF with LF to avoid ray logging to the same
+                        # line due to separating lines with '\n'.
+                        line = line[:-2] + '\n'
+                    if (args.skip_lines is not None and
+                            any(skip in line for skip in args.skip_lines)):
+                        continue
+                    if args.start_streaming_at in line:
+                        start_streaming_flag = True
+                    if (args.end_streaming_at is not None and
+                            args.end_streaming_at in line):
+                        # Keep executing the loop, only stop streaming.
+                        # E.g., this is used for `sky bench` to hide the
+                        # redundant messages of `sky launch` while
+                        # saving them in log files.
+                        end_streaming_flag = True
+                    if (args.stream_logs and start_streaming_flag and
+                            not end_streaming_flag):
+                        print(streaming_prefix + line, end='', file=out_stream)
+                    if args.log_path != '/dev/null':
+                        fout.write(line)
+                    line_processor.process_line(line)
+                    out.append(line)
+                # Flush once per block of lines read, instead of per line.
+                out_stream.flush()
+                fout.flush()
     return ''.join(out)
 
 
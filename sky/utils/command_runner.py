@@ -40,36 +40,45 @@ def _ssh_control_path(ssh_control_filename: Optional[str]) -> Optional[str]:
     return path
 
 
+# Options for 'ssh' that do not depend on the arguments of ssh_options_list().
+# Forked from Ray SSHOptions:
+# https://github.com/ray-project/ray/blob/master/python/ray/autoscaler/_private/command_runner.py
+_SSH_STATIC_OPTION_DICT = {
+    # Supresses initial fingerprint verification.
+    'StrictHostKeyChecking': 'no',
+    # SSH IP and fingerprint pairs no longer added to known_hosts.
+    # This is to remove a 'REMOTE HOST IDENTIFICATION HAS CHANGED'
+    # warning if a new node has the same IP as a previously
+    # deleted node, because the fingerprints will not match in
+    # that case.
+    'UserKnownHostsFile': os.devnull,
+    # Try fewer extraneous key pairs.
+    'IdentitiesOnly': 'yes',
+    # Abort if port forwarding fails (instead of just printing to
+    # stderr).
+    'ExitOnForwardFailure': 'yes',
+    # Quickly kill the connection if network connection breaks (as
+    # opposed to hanging/blocking).
+    'ServerAliveInterval': 5,
+    'ServerAliveCountMax': 3,
+    # Agent forwarding for git.
+    'ForwardAgent': 'yes',
+}
+# Flattened once, as ssh_options_list() is called for every ssh/rsync command.
+_SSH_STATIC_OPTIONS = [
+    x for k, v in _SSH_STATIC_OPTION_DICT.items() for x in ('-o', f'{k}={v}')
+]
+
+
 def ssh_options_list(ssh_private_key: Optional[str],
                      ssh_control_name: Optional[str],
                      *,
                      ssh_proxy_command: Optional[str] = None,
                      timeout: int = 30) -> List[str]:
     """Returns a list of sane options for 'ssh'."""
-    # Forked from Ray SSHOptions:
-    # https://github.com/ray-project/ray/blob/master/python/ray/autoscaler/_private/command_runner.py
     arg_dict = {
-        # Supresses initial fingerprint verification.
-        'StrictHostKeyChecking': 'no',
-        # SSH IP and fingerprint pairs no longer added to known_hosts.
-        # This is to remove a 'REMOTE HOST IDENTIFICATION HAS CHANGED'
-        # warning if a new node has the same IP as a previously
-        # deleted node, because the fingerprints will not match in
-        # that case.
-        'UserKnownHostsFile': os.devnull,
-        # Try fewer extraneous key pairs.
-        'IdentitiesOnly': 'yes',
-        # Abort if port forwarding fails (instead of just printing to
-        # stderr).
-        'ExitOnForwardFailure': 'yes',
-        # Quickly kill the connection if network connection breaks (as
-        # opposed to hanging/blocking).
-        'ServerAliveInterval': 5,
-        'ServerAliveCountMax': 3,
         # ConnectTimeout.
         'ConnectTimeout': f'{timeout}s',
-        # Agent forwarding for git.
-        'ForwardAgent': 'yes',
     }
     if ssh_control_name is not None:
         arg_dict.update({
@@ -91,7 +100,7 @@ def ssh_options_list(ssh_private_key: Optional[str],
             # must quote this value.
             'ProxyCommand': shlex.quote(ssh_proxy_command),
         })
-    return ssh_key_option + [
+    return ssh_key_option + _SSH_STATIC_OPTIONS + [
         x for y in (['-o', f'{k}={v}']
                     for k, v in arg_dict.items()
                     if v is not None) for x in y
@@ -30,6 +30,36 @@ _PAYLOAD_STR = '<sky-payload>{}</sky-payload>'
 
 logger = sky_logging.init_logger(__name__)
 
+# Use the libyaml-backed C loader/dumper when available, which are several
+# times faster than the pure-Python ones.
+_LIBYAML_AVAILABLE = getattr(yaml, '__with_libyaml__', False)
+_YAML_SAFE_LOADER = yaml.CSafeLoader if _LIBYAML_AVAILABLE else yaml.SafeLoader
+_YAML_SAFE_DUMPER = yaml.CSafeDumper if _LIBYAML_AVAILABLE else yaml.SafeDumper
+if not _LIBYAML_AVAILABLE:
+    # Printed to stderr once at import, rather than logged, as the logger
+    # writes to stdout, which is parsed for some commands run on the cluster.
+    sky_logging.print(
+        f'{colorama.Fore.YELLOW}WARNING: PyYAML is not built with the libyaml '
+        'C bindings; YAML parsing and dumping will be several times slower. '
+        'To fix: install libyaml (e.g., `apt install libyaml-dev` or '
+        '`brew install libyaml`) and reinstall PyYAML with '
+        '`pip install --force-reinstall --no-binary pyyaml pyyaml`.'
+        f'{colorama.Style.RESET_ALL}',
+        file=sys.stderr)
+# Matches the line breaks before top-level keys of a dumped YAML document.
+# Continuation lines of multi-line scalars are always indented, and the
+# document separator '---' starts with '-', so neither is matched.
+_YAML_TOP_LEVEL_LINE_BREAK_PATTERN = re.compile(r'\n(?=[^\s-])')
+# Strings that can be emitted as plain (unquoted) YAML scalars without being
+# resolved to another type, e.g. numbers or timestamps.
+_YAML_PLAIN_STR_PATTERN = re.compile(r'(?:~/|[A-Za-z_/])[A-Za-z0-9_./~-]*')
+# Words that YAML resolves to bools or null, case-insensitively.
+_YAML_RESERVED_WORDS = frozenset(
+    {'yes', 'no', 'true', 'false', 'on', 'off', 'null'})
+# The C dumper writes keys longer than 128 chars (with quoting) as explicit
+# '? ' keys; those are left to the YAML dumper, so that the output matches.
+_YAML_MAX_KEY_LENGTH = 128
+
 _usage_run_id = None
 
 
@@ -175,13 +205,13 @@ def user_and_hostname_hash() -> str:
 
 def read_yaml(path) -> Dict[str, Any]:
     with open(path, 'r') as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=_YAML_SAFE_LOADER)
     return config
 
 
 def read_yaml_all(path: str) -> List[Dict[str, Any]]:
     with open(path, 'r') as f:
-        config = yaml.safe_load_all(f)
+        config = yaml.load_all(f, Loader=_YAML_SAFE_LOADER)
         return list(config)
 
 
@@ -190,23 +220,114 @@ def dump_yaml(path, config) -> None:
         f.write(dump_yaml_str(config))
 
 
-def dump_yaml_str(config):
-    # https://github.com/yaml/pyyaml/issues/127
-    class LineBreakDumper(yaml.SafeDumper):
+def _fast_dump_yaml_scalar(value: Any) -> Optional[str]:
+    # Check the exact types, as the YAML safe dumper rejects subclasses (e.g.
+    # IntEnum members); those are left to it to raise the same error.
+    value_type = type(value)
+    if value is None:
+        return 'null'
+    if value_type is bool:
+        return 'true' if value else 'false'
+    if value_type is int:
+        return str(value)
+    if value_type is str:
+        # Non-ASCII and DEL characters may be line breaks or non-printable
+        # in YAML, and the YAML dumper writes multi-line strings over
+        # multiple lines; leave those to it.
+        if not value.isascii() or '\x7f' in value or '\n' in value:
+            return None
+        if (_YAML_PLAIN_STR_PATTERN.fullmatch(value) is not None and
+                value.lower() not in _YAML_RESERVED_WORDS):
+            return value
+        # A JSON string is a valid YAML double-quoted scalar.
+        return json.dumps(value)
+    # Floats and other types are left to the YAML dumper.
+    return None
+
+
+def _fast_dump_yaml_block(value: Any, indent: int) -> Optional[List[str]]:
+    """Returns the lines of a non-empty dict or list in YAML block style."""
+    prefix = ' ' * indent
+    lines: List[str] = []
+    # The caller makes sure that value is exactly a dict or a list.
+    if isinstance(value, dict):
+        for key, child in value.items():
+            # Keys are scalars, same as values.
+            key_str = _fast_dump_yaml_scalar(key)
+            if key_str is None or len(key_str) > _YAML_MAX_KEY_LENGTH:
+                return None
+            # Lists in a dict are not indented, same as PyYAML's output.
+            child_type = type(child)
+            child_indent = indent + 2 if child_type is dict else indent
+            child_lines = _fast_dump_yaml_entry(child, child_indent)
+            if child_lines is None:
+                return None
+            if isinstance(child_lines, str):
+                lines.append(f'{prefix}{key_str}: {child_lines}')
+            else:
+                lines.append(f'{prefix}{key_str}:')
+                lines.extend(child_lines)
+    else:
+        for child in value:
+            child_lines = _fast_dump_yaml_entry(child, indent + 2)
+            if child_lines is None:
+                return None
+            if isinstance(child_lines, str):
+                lines.append(f'{prefix}- {child_lines}')
+            else:
+                # Put the first line of a nested block on the '- ' line.
+                child_lines[0] = f'{prefix}- {child_lines[0][indent + 2:]}'
+                lines.extend(child_lines)
+    return lines
+
+
+def _fast_dump_yaml_entry(value: Any,
+                          indent: int) -> Optional[Union[str, List[str]]]:
+    """Returns an inline scalar string, or the lines of a nested block."""
+    value_type = type(value)
+    if value_type is dict or value_type is list:
+        if not value:
+            return '{}' if value_type is dict else '[]'
+        return _fast_dump_yaml_block(value, indent)
+    return _fast_dump_yaml_scalar(value)
+
+
+def _fast_dump_yaml_str(config: Any) -> Optional[str]:
+    """Dumps a config of known shape without the general YAML emitter.
+
+    Handles non-empty dicts of (nested) dicts, lists, single-line ASCII
+    strings, ints, bools and None, with keys of the same scalar types, which
+    covers the generated cluster configs. Returns None for anything else, in which case the caller should
+    fall back to the YAML dumper.
+    """
+    config_type = type(config)
+    if config_type is not dict or not config:
+        return None
+    lines = _fast_dump_yaml_block(config, 0)
+    if lines is None:
+        return None
+    yaml_str = '\n'.join(lines) + '\n'
+    # Add an empty line between top-level keys for readability.
+    return _YAML_TOP_LEVEL_LINE_BREAK_PATTERN.sub('\n\n', yaml_str)
 
-        def write_line_break(self, data=None):
-            super().write_line_break(data)
-            if len(self.indents) == 1:
-                super().write_line_break()
 
+def dump_yaml_str(config):
+    yaml_str = _fast_dump_yaml_str(config)
+    if yaml_str is not None:
+        return yaml_str
     if isinstance(config, list):
         dump_func = yaml.dump_all
     else:
         dump_func = yaml.dump
-    return dump_func(config,
-                     Dumper=LineBreakDumper,
-                     sort_keys=False,
-                     default_flow_style=False)
+    yaml_str = dump_func(config,
+                         Dumper=_YAML_SAFE_DUMPER,
+                         sort_keys=False,
+                         default_flow_style=False)
+    # Add an empty line between top-level keys for readability. This is done
+    # on the output string instead of overriding the dumper's
+    # write_line_break(), as the C dumper does not call back into Python.
+    # https://github.com/yaml/pyyaml/issues/127
+    return _YAML_TOP_LEVEL_LINE_BREAK_PATTERN.sub('\n\n', yaml_str)
 
 
 def make_decorator(cls, name_or_fn: Union[str, Callable], **ctx_kwargs):
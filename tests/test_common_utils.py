@@ -0,0 +1,120 @@
+import enum
+
+import pytest
+import yaml
+
+from sky.utils import common_utils
+
+
+@pytest.mark.parametrize(
+    'config',
+    [
+        # Reserved words that must stay strings.
+        {
+            'yes': 'yes',
+            'no': 'No',
+            'null': 'null',
+            'tilde': '~',
+            'on': 'ON',
+            'true': 'True',
+            '': '',
+        },
+        # Numeric-looking strings.
+        {
+            'int': '1',
+            'float': '1.5',
+            'exp': '1e3',
+            'hex': '0x1f',
+            'octal': '0o17',
+            'dot': '.5',
+            'inf': '.inf',
+            'date': '2023-01-01',
+            'neg': '-1',
+        },
+        # Scalars of other types.
+        {
+            'int': 1,
+            'neg': -2,
+            'bool': True,
+            'none': None,
+        },
+        # Empty containers.
+        {
+            'dict': {},
+            'list': [],
+            'nested': [{}, [], {
+                'a': []
+            }],
+        },
+        # Nested lists of lists and dicts.
+        {
+            'provider': {
+                'type': 'aws',
+                'region': 'us-east-1',
+            },
+            'lists': [[1, 2], [[3], {
+                'a': [4, {
+                    'b': None
+                }]
+            }]],
+            'dicts': [{
+                'a': 1,
+                'b': {
+                    'c': [1]
+                }
+            }, {
+                'd': 'e'
+            }],
+        },
+        # Strings with special characters.
+        {
+            'setup': 'echo hi\necho "x: y" && true\n  indented\n',
+            'file_mounts': {
+                '~/.sky/file': '/tmp/a b',
+                '/dev/null': '#comment',
+            },
+            'misc': ['- a', 'a: b', '{}', '[]', '&a', '*a', '!tag', '%', '|'],
+        },
+    ])
+def test_dump_yaml_str_round_trip(config):
+    assert yaml.safe_load(common_utils.dump_yaml_str(config)) == config
+
+
+def test_dump_yaml_str_blank_line_between_top_level_keys():
+    config = {'a': 1, 'b': {'c': [1, 2]}, 'd': 'x: y'}
+    expected = 'a: 1\n\nb:\n  c:\n  - 1\n  - 2\n\nd: "x: y"\n'
+    assert common_utils.dump_yaml_str(config) == expected
+
+
+def test_dump_yaml_str_multi_line_string():
+    # Multi-line strings are written over multiple lines, e.g. the usage
+    # collection counts the lines of the setup and run commands.
+    run = 'echo 1\necho 2\necho 3\necho 4'
+    yaml_str = common_utils.dump_yaml_str({'run': run})
+    assert yaml.safe_load(yaml_str) == {'run': run}
+    assert len(yaml_str.strip().split('\n')) >= 4
+
+
+def test_dump_yaml_str_fallback():
+    # Floats and non-ASCII strings are dumped by the YAML dumper.
+    config = {
+        'a': 1.5,
+        'b': {
+            'c': [1, 2]
+        },
+        'd': 'multi\nline',
+        'e': 'caf\u00e9',
+    }
+    yaml_str = common_utils.dump_yaml_str(config)
+    assert yaml.safe_load(yaml_str) == config
+    assert yaml_str == ('a: 1.5\n\nb:\n  c:\n  - 1\n  - 2\n\n'
+                        'd: \'multi\n\n  line\'\n\ne: "caf\\xE9"\n')
+
+
+def test_dump_yaml_str_rejects_subclasses():
+
+    class Color(enum.IntEnum):
+        RED = 1
+
+    with pytest.raises(yaml.representer.RepresenterError):
+        common_utils.dump_yaml_str({'k': Color.RED})
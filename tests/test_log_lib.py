@@ -0,0 +1,96 @@
+import io
+
+import pytest
+
+from sky.skylet import log_lib
+from sky.utils import log_utils
+
+
+class _ChunkedStream:
+    """A byte stream whose read1() returns the given chunks one by one."""
+
+    def __init__(self, chunks):
+        self._chunks = list(chunks)
+
+    def read1(self, size=-1):
+        del size  # unused
+        if not self._chunks:
+            return b''
+        return self._chunks.pop(0)
+
+
+class _RecordingLineProcessor(log_utils.LineProcessor):
+
+    def __init__(self):
+        self.lines = []
+
+    def process_line(self, log_line):
+        self.lines.append(log_line)
+
+
+def _expected_lines(data):
+    # The behavior before reading in blocks: readline() on a text wrapper.
+    wrapper = io.TextIOWrapper(io.BytesIO(data),
+                               encoding='utf-8',
+                               newline='',
+                               errors='replace')
+    return list(iter(wrapper.readline, ''))
+
+
+@pytest.mark.parametrize(
+    'chunks',
+    [
+        # Trailing '\r' held back until the next read.
+        [b'progress 1\r', b'progress 2\r', b'done\n'],
+        [b'line\r'],
+        # '\r\n' split across reads.
+        [b'a\r', b'\nb\r', b'\n'],
+        # Held back '\r' followed by chunks without a line break.
+        [b'a\r', b'b', b'c\r', b'\r', b'd\n'],
+        # Multi-byte UTF-8 characters split across reads.
+        [b'h\xc3', b'\xa9llo\n\xe2\x82', b'\xac\n'],
+        # '\x0c', '\x0b', '\x1c' and '\u2028' inside lines.
+        [b'a\x0cb\x0bc\x1cd\n', b'e\xe2\x80\xa8f\r\ng\n'],
+        # Invalid bytes.
+        [b'\x85\xff\n', b'ok\xc3\n'],
+        # Final line without a newline.
+        [b'first\n', b'last'],
+        [b'\n\n\r\r\n', b'x'],
+    ])
+def test_handle_io_stream(chunks):
+    line_processor = _RecordingLineProcessor()
+    out_stream = io.StringIO()
+    args = log_lib._ProcessingArgs('/dev/null',
+                                   True,
+                                   line_processor=line_processor)
+    output = log_lib._handle_io_stream(_ChunkedStream(chunks), out_stream, args)
+    expected = _expected_lines(b''.join(chunks))
+    assert line_processor.lines == expected
+    assert output == ''.join(expected)
+    assert out_stream.getvalue() == ''.join(expected)
+
+
+def test_handle_io_stream_replace_crlf(tmp_path):
+    log_path = str(tmp_path / 'run.log')
+    args = log_lib._ProcessingArgs(log_path, False, replace_crlf=True)
+    output = log_lib._handle_io_stream(_ChunkedStream([b'a\r', b'\nb\r\n']),
+                                       io.StringIO(), args)
+    assert output == 'a\nb\n'
+    with open(log_path, 'r') as f:
+        assert f.read() == 'a\nb\n'
+
+
+def test_handle_io_stream_long_line():
+    # Many chunks without a line break, with multi-byte characters split
+    # across chunks.
+    data = ('x\u00e9' * 3_000_000).encode('utf-8') + b'\r\n' + b'y' * 100_000
+    chunks = [data[i:i + 4099] for i in range(0, len(data), 4099)]
+    line_processor = _RecordingLineProcessor()
+    args = log_lib._ProcessingArgs('/dev/null',
+                                   False,
+                                   line_processor=line_processor)
+    output = log_lib._handle_io_stream(_ChunkedStream(chunks), io.StringIO(),
+                                       args)
+    expected = _expected_lines(data)
+    assert line_processor.lines == expected
+    assert output == ''.join(expected)